@@ -16,15 +16,25 @@ Phase 1: oracle_call — ask the human a question, wait for response.
 """
 
 import asyncio
-import json
+import ctypes
+import ctypes.util
+import heapq
+import itertools
 import logging
 import os
+import re
+import secrets
+import struct
+import sys
 import time
-import uuid
-from datetime import datetime, timezone
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Any
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Configure logging to stderr (never stdout in stdio servers)
@@ -40,12 +50,19 @@ REQUESTS_DIR = BUS_DIR / "requests"
 RESPONSES_DIR = BUS_DIR / "responses"
 HISTORY_DIR = BUS_DIR / "history"
 
-# Ensure directories exist
-for d in [BUS_DIR, REQUESTS_DIR, RESPONSES_DIR, HISTORY_DIR]:
-    d.mkdir(parents=True, exist_ok=True)
+# Created on first use rather than at import, so importing the module is free
+_DIRS_READY = False
+
+
+def _ensure_dirs():
+    """Create the bus directories once per process."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for d in [BUS_DIR, REQUESTS_DIR, RESPONSES_DIR, HISTORY_DIR]:
+        d.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
 
-# Initialize the MCP server
-mcp = FastMCP("oracle-mcp")
 
 # --- Ordinal Levels ---
 ORDINAL_LEVELS = {
@@ -55,40 +72,602 @@ ORDINAL_LEVELS = {
     3: "oracle",
 }
 
+# In-flight oracle calls, keyed by request ID. respond_to_oracle_call and the
+# bus watcher set the event so the waiting caller wakes immediately.
+PENDING: dict[str, asyncio.Event] = {}
+
+# Response files still being written in the background for callers that were
+# answered in memory. The exchange is archived once the write lands.
+_RESPONSE_WRITES: dict[str, asyncio.Future] = {}
+
+# In-memory mirror of the requests/ and responses/ directories, keyed by
+# request ID. Populated at startup and kept current by our own writes and the
+# bus watcher, so the status tools never have to touch the disk.
+# REQUEST_CACHE holds at most REQUEST_CACHE_SIZE entries; once it has evicted
+# anything, pending requests missing from it are read back from disk.
+REQUEST_CACHE_SIZE = 10_000
+REQUEST_CACHE: OrderedDict[str, dict] = OrderedDict()
+RESPONSE_CACHE: dict[str, dict] = {}
+_request_cache_overflowed = False
+
+# Most recent history entries, oldest first. History names start with the
+# archive timestamp, so bus_history can serve the newest entries from here
+# instead of sorting the whole history directory on every call.
+HISTORY_INDEX_SIZE = 1024
+RECENT_HISTORY: deque[Path] = deque(maxlen=HISTORY_INDEX_SIZE)
+_recent_history_paths: set[Path] = set()  # membership index for RECENT_HISTORY
+HISTORY_COUNT: int = 0
+
+# Worker threads for bus_history archive reads, so the kernel can overlap them
+_HISTORY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="oracle-history")
+
+# Requests carry a truncated copy of the question for the summary views, so
+# bus_status and bus_history never need the full (possibly very long) text.
+QUESTION_PREVIEW_CHARS = 120
+
+# --- Bus Watching ---
+# inotify(7) constants; see <sys/inotify.h>
+IN_MOVED_FROM = 0x00000040
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_ADDED = IN_CLOSE_WRITE | IN_MOVED_TO
+IN_REMOVED = IN_DELETE | IN_MOVED_FROM
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# Fallback sweep interval when inotify is unavailable (non-Linux)
+SWEEP_INTERVAL = 30.0
+
+# --- Durability ---
+# Directories whose entries changed since the last fsync. Rather than fsync the
+# directory after every rename, the flusher batches them: it waits up to
+# FSYNC_DELAY after the first write, or less if FSYNC_BATCH writes pile up.
+FSYNC_DELAY = 0.05
+FSYNC_BATCH = 16
+_DIRTY_DIRS: set[Path] = set()
+_dirty_writes = 0
+# The loop and events are created per server run in _bus_lifespan, since an
+# asyncio.Event is bound to the first loop that waits on it.
+_fsync_loop: asyncio.AbstractEventLoop | None = None
+_fsync_pending: asyncio.Event | None = None
+_fsync_batch_full: asyncio.Event | None = None
+
+
+def _fsync_dir(directory: Path):
+    """fsync a directory so renames into it survive a crash."""
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning(f"fsync failed for {directory}: {e}")
+
+
+def _flush_dirty_dirs():
+    """fsync every directory marked dirty since the last flush."""
+    global _dirty_writes
+    _dirty_writes = 0
+    while _DIRTY_DIRS:
+        _fsync_dir(_DIRTY_DIRS.pop())
+
+
+def _signal_flusher(batch_full: bool):
+    _fsync_pending.set()
+    if batch_full:
+        _fsync_batch_full.set()
+
+
+def _mark_dirty(directory: Path):
+    """Queue a directory fsync, or do it now if the flusher isn't running."""
+    global _dirty_writes
+    loop = _fsync_loop
+    if loop is None:
+        _fsync_dir(directory)
+        return
+
+    _DIRTY_DIRS.add(directory)
+    _dirty_writes += 1
+    batch_full = _dirty_writes >= FSYNC_BATCH
+    try:
+        in_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        in_loop = False
+    if in_loop:
+        _signal_flusher(batch_full)
+    else:
+        loop.call_soon_threadsafe(_signal_flusher, batch_full)
+
+
+async def _fsync_flusher():
+    """Batch directory fsyncs so a burst of bus writes costs one flush per directory."""
+    while True:
+        await _fsync_pending.wait()
+        with suppress(TimeoutError):
+            await asyncio.wait_for(_fsync_batch_full.wait(), FSYNC_DELAY)
+        _fsync_pending.clear()
+        _fsync_batch_full.clear()
+        await asyncio.to_thread(_flush_dirty_dirs)
+
+
+def _atomic_write_json(path: Path, data: dict):
+    """Write JSON via a temp file and rename, so readers never see a partial file.
+
+    The temp name is unique per write so concurrent writers of the same target
+    (e.g. two responders racing on one request) never share a temp file, and
+    the data is fsynced before the rename so a crash cannot leave the renamed
+    file empty. The rename itself is made durable by the batched directory fsync.
+    """
+    _ensure_dirs()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    payload = memoryview(
+        orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+    _mark_dirty(path.parent)
+
+
+def _utc_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds, e.g. 2026-02-07T14:30:52.123456Z."""
+    t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{int(t % 1 * 1e6):06d}Z"
+
+
+def _list_json(directory: Path) -> list[str]:
+    """List the names of JSON files in a directory.
+
+    os.scandir reports the entry type from the directory read itself, so
+    this costs no per-file stat or Path allocation.
+    """
+    with os.scandir(directory) as it:
+        return [
+            entry.name for entry in it
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        ]
+
+
+# Cheap pre-check for _load_json: bus files always hold a single JSON object
+_JSON_OBJECT_START = re.compile(rb"\s*\{")
+
+
+def _read_file(path: Path) -> bytes:
+    """Read a whole file with raw os.read calls.
+
+    Bus files are small, so one read usually suffices, and skipping open()
+    avoids building a FileIO/BufferedReader stack for every read.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, 65536)
+        while chunk := os.read(fd, 65536):
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _load_json(path: Path) -> dict | None:
+    """Parse a bus file, returning None if it is missing or unreadable.
+
+    Every bus file is a JSON object, so anything not starting with "{" (e.g.
+    an empty file left by a crashed writer) is rejected before decoding.
+    """
+    try:
+        data = _read_file(path)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Skipping unreadable bus file {path}: {e}")
+        return None
+
+    if not _JSON_OBJECT_START.match(data):
+        logger.warning(f"Skipping malformed bus file {path}: not a JSON object")
+        return None
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Skipping malformed bus file {path}: {e}")
+        return None
+
 
 def _write_request(request_id: str, data: dict) -> Path:
     """Write a request to the bus."""
     path = REQUESTS_DIR / f"{request_id}.json"
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    _atomic_write_json(path, data)
+    _cache_put(request_id, data)
     logger.info(f"Request written: {request_id}")
     return path
 
 
 def _read_response(request_id: str) -> dict | None:
     """Read a response from the bus, if available."""
-    path = RESPONSES_DIR / f"{request_id}.json"
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return None
+    response = RESPONSE_CACHE.get(request_id)
+    if response is None:
+        response = _load_json(RESPONSES_DIR / f"{request_id}.json")
+    return response
 
 
 def _archive_exchange(request_id: str):
-    """Move completed request/response pair to history."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    archive_dir = HISTORY_DIR / timestamp
-    archive_dir.mkdir(parents=True, exist_ok=True)
+    """Fold the completed request/response pair into a single history file."""
+    archive_path = HISTORY_DIR / f"{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}_{request_id}.json"
 
     req_path = REQUESTS_DIR / f"{request_id}.json"
     resp_path = RESPONSES_DIR / f"{request_id}.json"
 
-    if req_path.exists():
-        req_path.rename(archive_dir / f"request_{request_id}.json")
-    if resp_path.exists():
-        resp_path.rename(archive_dir / f"response_{request_id}.json")
+    entry = {
+        "request": REQUEST_CACHE.get(request_id) or _fallback_read(request_id),
+        "response": _read_response(request_id),
+        "archived_at": _utc_iso(),
+    }
+    _atomic_write_json(archive_path, entry)
+
+    req_path.unlink(missing_ok=True)
+    resp_path.unlink(missing_ok=True)
 
-    logger.info(f"Exchange archived: {request_id} -> {archive_dir}")
+    REQUEST_CACHE.pop(request_id, None)
+    RESPONSE_CACHE.pop(request_id, None)
+    _index_archive(archive_path)
+    logger.info(f"Exchange archived: {request_id} -> {archive_path}")
+
+
+def _archive_after_write(request_id: str, write: asyncio.Future):
+    """Archive an exchange once its background response write has finished."""
+    if not write.cancelled() and write.exception() is not None:
+        logger.warning(f"Response write failed for {request_id}: {write.exception()}")
+    _archive_exchange(request_id)
+
+
+def _timestamp_key(req: dict) -> str:
+    """Sort key for a request's timestamp; files from other tools may not use a string."""
+    return str(req.get("timestamp", ""))
+
+
+def _read_archive(path: Path) -> list[dict]:
+    """Load the exchanges stored at one history path, newest first.
+
+    Each exchange is {"request": ..., "response": ..., "archived_at": ...}.
+    Exchanges archived before the combined format live in per-second
+    directories that may hold several request_<id>.json / response_<id>.json
+    pairs, so a legacy directory yields one entry per request ID.
+    """
+    if path.suffix == ".json":
+        entry = _load_json(path)
+        return [entry] if entry is not None else []
+    if not path.is_dir():
+        return []
+
+    pairs: dict[str, dict] = {}
+    for name in _list_json(path):
+        kind, _, request_id = name.removesuffix(".json").partition("_")
+        if kind in ("request", "response") and request_id:
+            pair = pairs.setdefault(request_id, {"request": None, "response": None, "archived_at": path.name})
+            pair[kind] = _load_json(path / name)
+    return sorted(
+        pairs.values(),
+        key=lambda entry: _timestamp_key(entry["request"] or {}),
+        reverse=True,
+    )
+
+
+def _index_archive(path: Path):
+    """Record a newly archived exchange in RECENT_HISTORY and HISTORY_COUNT."""
+    global HISTORY_COUNT
+    if path in _recent_history_paths:
+        return
+    if len(RECENT_HISTORY) == HISTORY_INDEX_SIZE:
+        _recent_history_paths.discard(RECENT_HISTORY[0])
+    RECENT_HISTORY.append(path)
+    _recent_history_paths.add(path)
+    HISTORY_COUNT += 1
+
+
+def _unindex_archive(path: Path):
+    """Drop a deleted history entry from RECENT_HISTORY and HISTORY_COUNT."""
+    global HISTORY_COUNT
+    HISTORY_COUNT = max(HISTORY_COUNT - 1, 0)
+    if path in _recent_history_paths:
+        _recent_history_paths.discard(path)
+        RECENT_HISTORY.remove(path)
+
+
+def _question_preview(req: dict) -> str:
+    """Return the stored question preview, falling back to the full question."""
+    return req.get("question_preview") or req.get("question", "?")
+
+
+def _format_archive(path: Path, entry: dict) -> str:
+    """Render one history entry for bus_history, ending in a blank line."""
+    req = entry.get("request") or {}
+    resp = entry.get("response")
+    answer = (
+        f"  A: {resp.get('answer', '(no answer)')[:80]}\n"
+        f"  Responder: {resp.get('responder', '?')}\n"
+        if resp is not None else ""
+    )
+    return (
+        f"[{req.get('id', '?')}] Q: {_question_preview(req)[:80]}\n"
+        f"  Urgency: {req.get('urgency', 'normal')} | Status: {req.get('status', '?')}\n"
+        f"{answer}"
+        f"  Archived: {entry.get('archived_at', path.name)}\n"
+    )
+
+
+def _cache_put(request_id: str, data: dict):
+    """Insert into REQUEST_CACHE, evicting the least recently written entry when full."""
+    global _request_cache_overflowed
+    REQUEST_CACHE[request_id] = data
+    REQUEST_CACHE.move_to_end(request_id)
+    if len(REQUEST_CACHE) > REQUEST_CACHE_SIZE:
+        REQUEST_CACHE.popitem(last=False)
+        _request_cache_overflowed = True
+
+
+def _fallback_read(request_id: str) -> dict | None:
+    """Read a pending request from disk, for entries not in REQUEST_CACHE."""
+    return _load_json(REQUESTS_DIR / f"{request_id}.json")
+
+
+def _pending_requests() -> list[dict]:
+    """Return pending requests, oldest first.
+
+    Served from REQUEST_CACHE; only after the cache has evicted entries do we
+    list requests/ and read the missing ones from disk.
+    """
+    pending = list(REQUEST_CACHE.values())
+    if _request_cache_overflowed:
+        for name in _list_json(REQUESTS_DIR):
+            request_id = name.removesuffix(".json")
+            if request_id not in REQUEST_CACHE and (req := _fallback_read(request_id)) is not None:
+                pending.append(req)
+    return sorted(pending, key=lambda req: (_timestamp_key(req), str(req.get("id", ""))))
+
+
+def _scan_dir(directory: Path) -> dict[str, dict]:
+    """Parse every JSON file in a bus directory, keyed by request ID."""
+    entries = {}
+    for name in _list_json(directory):
+        data = _load_json(directory / name)
+        if data is not None:
+            entries[name.removesuffix(".json")] = data
+    return entries
+
+
+def _load_caches():
+    """Rebuild the request/response caches from disk."""
+    global _request_cache_overflowed
+    requests = _scan_dir(REQUESTS_DIR)
+    REQUEST_CACHE.clear()
+    _request_cache_overflowed = False
+    # Insert oldest first so the newest requests are the ones kept
+    for request_id, data in sorted(requests.items(), key=lambda item: (_timestamp_key(item[1]), item[0])):
+        _cache_put(request_id, data)
+
+    responses = _scan_dir(RESPONSES_DIR)
+    # Answers delivered in memory may not have reached the disk yet; keep them
+    for request_id in _RESPONSE_WRITES:
+        if request_id in RESPONSE_CACHE:
+            responses.setdefault(request_id, RESPONSE_CACHE[request_id])
+    RESPONSE_CACHE.clear()
+    RESPONSE_CACHE.update(responses)
+
+
+def _scan_history() -> list[str]:
+    """List every entry in history/, skipping in-flight temp files."""
+    with os.scandir(HISTORY_DIR) as it:
+        return [entry.name for entry in it if not entry.name.endswith(".tmp")]
+
+
+def _load_history_index(names: list[str]):
+    """Rebuild HISTORY_COUNT and RECENT_HISTORY from a listing of history/.
+
+    Listing history/ is O(history size), so this runs at startup, on each bus
+    sweep, and when deletions have left the index short; otherwise the index
+    is maintained incrementally by _archive_exchange and the bus watcher.
+    """
+    global HISTORY_COUNT
+    HISTORY_COUNT = len(names)
+    newest = heapq.nlargest(HISTORY_INDEX_SIZE, names)
+    RECENT_HISTORY.clear()
+    RECENT_HISTORY.extend(HISTORY_DIR / name for name in reversed(newest))
+    _recent_history_paths.clear()
+    _recent_history_paths.update(RECENT_HISTORY)
+
+
+def _inotify_watch(paths: list[Path], mask: int) -> tuple[int, dict[int, Path]] | None:
+    """Open a non-blocking inotify fd watching paths, or None if unsupported.
+
+    Returns the fd and a map of watch descriptors to the watched directory.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        logger.warning(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        return None
+    watches = {}
+    for path in paths:
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), mask)
+        if wd < 0:
+            logger.warning(f"inotify_add_watch failed: {os.strerror(ctypes.get_errno())}")
+            os.close(fd)
+            return None
+        watches[wd] = path
+    return fd, watches
+
+
+def _drain_inotify(fd: int) -> list[tuple[int, int, str]]:
+    """Read every queued inotify event until EAGAIN.
+
+    Returns (wd, mask, name) for each event; overflow events have no name.
+    """
+    events = []
+    while True:
+        try:
+            buf = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            break
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(buf, offset)
+            offset += _INOTIFY_EVENT.size
+            name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, name))
+    return events
+
+
+def _sweep_bus():
+    """Resync the caches and history index from disk and wake every answered call."""
+    _load_caches()
+    _load_history_index(_scan_history())
+    for request_id, event in list(PENDING.items()):
+        if request_id in RESPONSE_CACHE:
+            event.set()
+
+
+def _on_bus_event(directory: Path, mask: int, name: str):
+    """Apply one inotify event to the caches and wake any waiting caller."""
+    if directory == HISTORY_DIR:
+        # Archive files normally appear by rename, but peers on older code
+        # mkdir legacy per-second directories and other tools write in place
+        if name.endswith(".tmp"):
+            return
+        if mask & IN_ADDED or (mask & IN_CREATE and mask & IN_ISDIR):
+            _index_archive(directory / name)
+        elif mask & IN_REMOVED:
+            _unindex_archive(directory / name)
+        return
+    if not name.endswith(".json"):
+        return
+    request_id = name.removesuffix(".json")
+    cache = REQUEST_CACHE if directory == REQUESTS_DIR else RESPONSE_CACHE
+
+    if mask & IN_REMOVED:
+        cache.pop(request_id, None)
+        return
+    if not mask & IN_ADDED:
+        return
+
+    data = _load_json(directory / name)
+    if data is None:
+        return
+    if directory == REQUESTS_DIR:
+        _cache_put(request_id, data)
+        return
+    RESPONSE_CACHE[request_id] = data
+    event = PENDING.get(request_id)
+    if event is not None:
+        event.set()
+
+
+async def _watch_bus():
+    """Mirror the bus directories into memory.
+
+    Requests, responses and archives usually come from other processes
+    (subagent servers, the Telegram relay), so the in-process event alone
+    never fires for them. On Linux a single inotify fd watches every bus
+    directory; elsewhere we fall back to a coarse periodic sweep.
+    """
+    watch = _inotify_watch([REQUESTS_DIR, RESPONSES_DIR, HISTORY_DIR], IN_ADDED | IN_CREATE | IN_REMOVED)
+    loop = asyncio.get_running_loop()
+    try:
+        # Scan only after the watch is in place so nothing written in between is missed
+        try:
+            _load_caches()
+            _load_history_index(_scan_history())
+        except Exception:
+            logger.exception("Initial bus scan failed")
+
+        if watch is None:
+            logger.info(f"inotify unavailable, sweeping bus every {SWEEP_INTERVAL:.0f}s")
+            while True:
+                await asyncio.sleep(SWEEP_INTERVAL)
+                try:
+                    _sweep_bus()
+                except Exception:
+                    logger.exception("Bus sweep failed")
+
+        fd, watches = watch
+        readable = asyncio.Event()
+        loop.add_reader(fd, readable.set)
+        while True:
+            await readable.wait()
+            readable.clear()
+            for wd, mask, name in _drain_inotify(fd):
+                try:
+                    if mask & IN_Q_OVERFLOW:
+                        logger.warning("inotify queue overflowed, resyncing bus")
+                        _sweep_bus()
+                    elif wd in watches:
+                        _on_bus_event(watches[wd], mask, name)
+                except Exception:
+                    logger.exception(f"Failed to handle bus event for {name!r}")
+    finally:
+        if watch is not None:
+            loop.remove_reader(watch[0])
+            os.close(watch[0])
+
+
+@asynccontextmanager
+async def _bus_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Run the bus watcher and fsync flusher for as long as the server is up."""
+    global _fsync_loop, _fsync_pending, _fsync_batch_full, _dirty_writes
+    _ensure_dirs()
+    _DIRTY_DIRS.clear()
+    _dirty_writes = 0
+    _fsync_pending = asyncio.Event()
+    _fsync_batch_full = asyncio.Event()
+    _fsync_loop = loop = asyncio.get_running_loop()
+    tasks = {"flusher": asyncio.create_task(_fsync_flusher())}
+    restart: asyncio.TimerHandle | None = None
+
+    def start_watcher():
+        tasks["watcher"] = asyncio.create_task(_watch_bus())
+        tasks["watcher"].add_done_callback(on_watcher_done)
+
+    def on_watcher_done(task: asyncio.Task):
+        nonlocal restart
+        if task.cancelled():
+            return
+        logger.error("Bus watcher crashed, restarting in 1s", exc_info=task.exception())
+        restart = loop.call_later(1.0, start_watcher)
+
+    start_watcher()
+    try:
+        yield
+    finally:
+        if restart is not None:
+            restart.cancel()
+        for task in tasks.values():
+            task.cancel()
+        for task in tasks.values():
+            with suppress(asyncio.CancelledError):
+                await task
+        _fsync_loop = None
+        _flush_dirty_dirs()
+
+
+# Initialize the MCP server
+mcp = FastMCP("oracle-mcp", lifespan=_bus_lifespan)
 
 
 @mcp.tool()
@@ -117,8 +696,9 @@ async def oracle_call(
         timeout_seconds: How long to wait for a response (default 300s / 5min).
         from_level: Your ordinal level. Use 1 if you are a subagent, 2 if you are the orchestrator (default 2).
     """
-    request_id = str(uuid.uuid4())[:8]
-    timestamp = datetime.now(timezone.utc).isoformat()
+    # Hex millisecond timestamp + 16 random bits: sorts by creation time
+    request_id = f"{int(time.time() * 1000):011x}{secrets.token_hex(2)}"
+    timestamp = _utc_iso()
 
     # Route to the next level up
     to_level = from_level + 1
@@ -129,29 +709,50 @@ async def oracle_call(
         "from_level": from_level,
         "to_level": to_level,
         "question": question,
+        "question_preview": question[:QUESTION_PREVIEW_CHARS],
         "context": context,
         "urgency": urgency,
         "timestamp": timestamp,
         "status": "pending",
     }
 
+    event = asyncio.Event()
+    PENDING[request_id] = event
     _write_request(request_id, request_data)
     logger.info(f"Oracle call dispatched: {request_id} — {question[:80]}")
 
-    # Poll for response
-    start_time = time.time()
-    poll_interval = 2.0  # seconds between checks
-
-    while (time.time() - start_time) < timeout_seconds:
+    # Wait for the response. An in-process responder hands the answer over in
+    # RESPONSE_CACHE and sets the event directly; the bus watcher does the same
+    # when another process writes the response file.
+    deadline = time.monotonic() + timeout_seconds
+
+    try:
+        while True:
+            await asyncio.wait_for(event.wait(), deadline - time.monotonic())
+            response = _read_response(request_id)
+            if response is not None:
+                break
+            event.clear()
+    except TimeoutError:
+        # An answer may have been handed over just as the deadline hit
         response = _read_response(request_id)
-        if response is not None:
-            _archive_exchange(request_id)
-            answer = response.get("answer", "(no answer provided)")
-            responder = response.get("responder", "oracle")
-            logger.info(f"Oracle response received: {request_id} from {responder}")
-            return f"Oracle response ({responder}): {answer}"
+    finally:
+        PENDING.pop(request_id, None)
+        # If the answer was delivered in memory, archive once its response
+        # file lands, even when this call was cancelled before resuming
+        pending_write = _RESPONSE_WRITES.pop(request_id, None)
+        if pending_write is not None:
+            pending_write.add_done_callback(
+                lambda write: _archive_after_write(request_id, write)
+            )
 
-        await asyncio.sleep(poll_interval)
+    if response is not None:
+        if pending_write is None:
+            _archive_exchange(request_id)
+        answer = response.get("answer", "(no answer provided)")
+        responder = response.get("responder", "oracle")
+        logger.info(f"Oracle response received: {request_id} from {responder}")
+        return f"Oracle response ({responder}): {answer}"
 
     # Timeout — archive the unanswered request
     request_data["status"] = "timeout"
@@ -162,41 +763,40 @@ async def oracle_call(
 
 
 @mcp.tool()
-def bus_status() -> str:
+async def bus_status() -> str:
     """Check the current status of the ordinal bus.
 
     Returns information about pending requests, recent responses,
     and bus health.
     """
-    pending_requests = list(REQUESTS_DIR.glob("*.json"))
-    pending_responses = list(RESPONSES_DIR.glob("*.json"))
-    history_entries = list(HISTORY_DIR.iterdir())
+    pending_requests = _pending_requests()
 
     status_lines = [
         "=== Oracle Bus Status ===",
         f"Bus directory: {BUS_DIR}",
         f"Pending requests: {len(pending_requests)}",
-        f"Pending responses: {len(pending_responses)}",
-        f"Historical exchanges: {len(history_entries)}",
+        f"Pending responses: {len(RESPONSE_CACHE)}",
+        f"Historical exchanges: {HISTORY_COUNT}",
         "",
     ]
 
     if pending_requests:
-        status_lines.append("--- Pending Requests ---")
-        for req_path in sorted(pending_requests):
-            with open(req_path) as f:
-                req = json.load(f)
-            status_lines.append(
+        status_lines = itertools.chain(
+            status_lines,
+            ["--- Pending Requests ---"],
+            (
                 f"  [{req.get('id', '?')}] {req.get('urgency', 'normal').upper()}: "
-                f"{req.get('question', '?')[:60]}"
-            )
-        status_lines.append("")
+                f"{_question_preview(req)[:60]}"
+                for req in pending_requests
+            ),
+            [""],
+        )
 
     return "\n".join(status_lines)
 
 
 @mcp.tool()
-def respond_to_oracle_call(request_id: str, answer: str) -> str:
+async def respond_to_oracle_call(request_id: str, answer: str) -> str:
     """Respond to a pending oracle call.
 
     This is used by the oracle (Micah) or the orchestrator (Rhode) to
@@ -206,97 +806,109 @@ def respond_to_oracle_call(request_id: str, answer: str) -> str:
         request_id: The ID of the request to respond to.
         answer: The answer to the question.
     """
-    req_path = REQUESTS_DIR / f"{request_id}.json"
-    if not req_path.exists():
+    request_data = REQUEST_CACHE.get(request_id)
+    if request_data is None:
+        request_data = _fallback_read(request_id)
+    if request_data is None:
         return f"No pending request found with ID: {request_id}"
 
-    with open(req_path) as f:
-        request_data = json.load(f)
-
     response_data = {
         "id": request_id,
         "type": "oracle_response",
         "question": request_data.get("question", ""),
         "answer": answer,
         "responder": "oracle",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_iso(),
     }
 
     resp_path = RESPONSES_DIR / f"{request_id}.json"
-    with open(resp_path, "w") as f:
-        json.dump(response_data, f, indent=2, default=str)
+    loop = asyncio.get_running_loop()
+
+    event = PENDING.get(request_id)
+    if event is not None:
+        # The caller is waiting in this process: deliver the answer from memory
+        # now and write the response file in the background for the audit trail
+        RESPONSE_CACHE[request_id] = response_data
+        _RESPONSE_WRITES[request_id] = loop.run_in_executor(
+            None, _atomic_write_json, resp_path, response_data
+        )
+        event.set()
+    else:
+        # Cache only once the file exists, so a failed write leaves no phantom answer
+        await loop.run_in_executor(None, _atomic_write_json, resp_path, response_data)
+        RESPONSE_CACHE[request_id] = response_data
 
     logger.info(f"Response written for request: {request_id}")
+
     return f"Response recorded for request {request_id}. The caller will receive it shortly."
 
 
 @mcp.tool()
-def list_pending_calls() -> str:
+async def list_pending_calls() -> str:
     """List all pending oracle calls waiting for a response.
 
     Use this to see what questions are waiting on the bus.
     """
-    pending = list(REQUESTS_DIR.glob("*.json"))
+    pending = _pending_requests()
 
     if not pending:
         return "No pending oracle calls on the bus."
 
-    lines = ["=== Pending Oracle Calls ===", ""]
-    for req_path in sorted(pending):
-        with open(req_path) as f:
-            req = json.load(f)
-
-        lines.append(f"Request ID: {req.get('id', '?')}")
-        lines.append(f"  Question: {req.get('question', '?')}")
-        lines.append(f"  Context: {req.get('context', '(none)')}")
-        lines.append(f"  Urgency: {req.get('urgency', 'normal')}")
-        lines.append(f"  Time: {req.get('timestamp', '?')}")
-        lines.append(f"  Status: {req.get('status', 'pending')}")
-        lines.append("")
-
-    return "\n".join(lines)
+    # One multi-line string per request; the trailing newline leaves a blank separator
+    return "\n".join(itertools.chain(
+        ["=== Pending Oracle Calls ===", ""],
+        (
+            f"Request ID: {req.get('id', '?')}\n"
+            f"  Question: {req.get('question', '?')}\n"
+            f"  Context: {req.get('context', '(none)')}\n"
+            f"  Urgency: {req.get('urgency', 'normal')}\n"
+            f"  Time: {req.get('timestamp', '?')}\n"
+            f"  Status: {req.get('status', 'pending')}\n"
+            for req in pending
+        ),
+    ))
 
 
 @mcp.tool()
-def bus_history(limit: int = 10) -> str:
+async def bus_history(limit: int = 10) -> str:
     """View recent oracle call history.
 
     Args:
-        limit: Maximum number of historical exchanges to show (default 10).
+        limit: Maximum number of historical exchanges to show (default 10, at most 1024).
     """
-    history_dirs = sorted(HISTORY_DIR.iterdir(), reverse=True)[:limit]
-
-    if not history_dirs:
+    limit = max(limit, 0)
+    loop = asyncio.get_running_loop()
+
+    # Deleted archives leave the index short of what is still on disk; refill it
+    if len(RECENT_HISTORY) < min(limit, HISTORY_COUNT, HISTORY_INDEX_SIZE):
+        _load_history_index(await loop.run_in_executor(_HISTORY_POOL, _scan_history))
+
+    history = list(itertools.islice(reversed(RECENT_HISTORY), limit))
+
+    # Archives live only on disk; read them concurrently off the event loop
+    archives = await asyncio.gather(
+        *(loop.run_in_executor(_HISTORY_POOL, _read_archive, path) for path in history)
+    )
+
+    # A legacy directory can hold several exchanges, so cap the flattened list
+    rendered = list(itertools.islice(
+        (
+            _format_archive(path, entry)
+            for path, entries in zip(history, archives)
+            for entry in entries
+        ),
+        limit,
+    ))
+    if not rendered:
         return "No history on the bus yet."
 
-    lines = ["=== Oracle Bus History ===", ""]
-    for hist_dir in history_dirs:
-        if not hist_dir.is_dir():
-            continue
-        req_files = list(hist_dir.glob("request_*.json"))
-        resp_files = list(hist_dir.glob("response_*.json"))
-
-        for req_file in req_files:
-            with open(req_file) as f:
-                req = json.load(f)
-            lines.append(f"[{req.get('id', '?')}] Q: {req.get('question', '?')[:80]}")
-            lines.append(f"  Urgency: {req.get('urgency', 'normal')} | Status: {req.get('status', '?')}")
-
-        for resp_file in resp_files:
-            with open(resp_file) as f:
-                resp = json.load(f)
-            lines.append(f"  A: {resp.get('answer', '(no answer)')[:80]}")
-            lines.append(f"  Responder: {resp.get('responder', '?')}")
-
-        lines.append(f"  Archived: {hist_dir.name}")
-        lines.append("")
-
-    return "\n".join(lines)
+    return "\n".join(itertools.chain(["=== Oracle Bus History ===", ""], rendered))
 
 
 def main():
     """Run the Oracle-MCP server on stdio transport."""
     logger.info("Oracle-MCP starting...")
+    _ensure_dirs()
     logger.info(f"Bus directory: {BUS_DIR}")
     logger.info(f"Ordinal levels: {ORDINAL_LEVELS}")
     mcp.run(transport="stdio")